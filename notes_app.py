@@ -5,15 +5,194 @@ A simple note-taking application with save/load functionality using Tkinter
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, scrolledtext
 from PIL import Image, ImageTk
 import json
 import os
+import re
 from datetime import datetime
 import threading
-import subprocess
+import time
+import uuid
+import http.client
+from collections import OrderedDict
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: faster (de)serialization of notes and config
+except ImportError:
+    orjson = None
+
+# Ollama daemon address, honouring the same OLLAMA_HOST variable as the CLI
+_ollama_host = os.environ.get('OLLAMA_HOST', '127.0.0.1:11434').split('://')[-1].rstrip('/')
+OLLAMA_HOST = _ollama_host if ':' in _ollama_host else f"{_ollama_host}:11434"
+
+# Common keywords for different languages
+_LANG_KEYWORDS = {
+    'python': ['def', 'class', 'import', 'from', 'if', 'else', 'elif', 'for', 'while', 'return', 'try', 'except', 'with', 'as', 'in', 'is', 'and', 'or', 'not', 'None', 'True', 'False'],
+    'javascript': ['function', 'const', 'let', 'var', 'if', 'else', 'for', 'while', 'return', 'class', 'import', 'export', 'from', 'async', 'await', 'true', 'false', 'null'],
+    'java': ['public', 'private', 'class', 'static', 'void', 'int', 'String', 'if', 'else', 'for', 'while', 'return', 'new', 'true', 'false', 'null'],
+    'c': ['int', 'char', 'float', 'double', 'if', 'else', 'for', 'while', 'return', 'void', 'struct', 'typedef', 'include'],
+    'cpp': ['int', 'char', 'float', 'double', 'if', 'else', 'for', 'while', 'return', 'void', 'class', 'public', 'private', 'namespace', 'using'],
+}
+
+# Comment syntax of each highlighted language; shell scripts also get Python-style keywords
+_COMMENT_PATTERNS = {
+    'python': r'#.*$', 'bash': r'#.*$', 'shell': r'#.*$',
+    'javascript': r'//.*$', 'java': r'//.*$', 'c': r'//.*$', 'cpp': r'//.*$'
+}
+# Quoted strings with backslash escapes; each character is consumed once and
+# an unterminated quote fails without backtracking across the line
+_STRING_PATTERN = r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\''
+_NUMBER_PATTERN = r'\b\d+\.?\d*\b'
+
+# One regex per language with a named group per tag, so a single finditer
+# classifies every token via match.lastgroup
+_HIGHLIGHT_RE = {
+    lang: re.compile(
+        f'(?P<comment>{comment})|(?P<string>{_STRING_PATTERN})|(?P<number>{_NUMBER_PATTERN})'
+        r'|(?P<keyword>\b(?:' + '|'.join(map(re.escape, _LANG_KEYWORDS.get(lang, _LANG_KEYWORDS['python']))) + r')\b)',
+        re.MULTILINE
+    )
+    for lang, comment in _COMMENT_PATTERNS.items()
+}
+
+# Languages the code preview styles
+_HIGHLIGHTED_LANGS = frozenset(_HIGHLIGHT_RE)
+
+def dump_json(data, compact=False):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def read_json(path):
+    """Read and parse a UTF-8 JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Linux reports wheel motion as buttons 4 (up) and 5 (down)
+_WHEEL = {4: -1, 5: 1}
+
+def _mousewheel_dispatch(event):
+    """Scroll the widget under the wheel, shared by every bind_mousewheel binding"""
+    step = _WHEEL.get(event.num)
+    if step is None:
+        # Windows and macOS use event.delta
+        step = -int(event.delta / 120)
+    event.widget.yview_scroll(step, "units")
+
+# AI output languages as (display name, config value)
+_LANGUAGES = (
+    ("English", "english"),
+    ("বাংলা (Bengali)", "bengali"),
+    ("한국어 (Korean)", "korean")
+)
+_LANG_MAP = dict(_LANGUAGES)
+_LANG_REVERSE = {value: name for name, value in _LANGUAGES}
+_LANG_DISPLAY = tuple(name for name, _ in _LANGUAGES)
+
+# Settings dialog choices as (display name, value)
+_THEME_CHOICES = (
+    ("Pink (Default)", "pink"),
+    ("Dark Mode", "dark"),
+    ("Light Mode", "light"),
+    ("Ocean Blue", "ocean"),
+    ("Forest Green", "forest")
+)
+_FONT_FAMILIES = ("Roboto Mono", "Ubuntu Mono", "Courier New", "Monospace", "Arial", "Times New Roman")
+_TEXT_COLORS = (("Black", "#000000"), ("Blue", "#0000FF"), ("Green", "#008000"), ("Red", "#FF0000"), ("Purple", "#800080"), ("White", "#FFFFFF"))
+_BG_COLORS = (("White", "#FFFFFF"), ("Light Gray", "#F0F0F0"), ("Cream", "#FFFDD0"), ("Light Blue", "#E6F2FF"), ("Light Green", "#E8F5E9"), ("Black", "#000000"))
+
+# Colors of each preset theme
+_THEMES = {
+    "pink": {
+        'text_color': '#000000',
+        'bg_color': '#FFFFFF',
+        'sidebar_bg': '#ffe8f0',
+        'editor_bg': '#fff0f5'
+    },
+    "dark": {
+        'text_color': '#FFFFFF',
+        'bg_color': '#1E1E1E',
+        'sidebar_bg': '#252525',
+        'editor_bg': '#2D2D2D'
+    },
+    "light": {
+        'text_color': '#000000',
+        'bg_color': '#FFFFFF',
+        'sidebar_bg': '#F5F5F5',
+        'editor_bg': '#FAFAFA'
+    },
+    "ocean": {
+        'text_color': '#003366',
+        'bg_color': '#E6F2FF',
+        'sidebar_bg': '#CCE5FF',
+        'editor_bg': '#E6F2FF'
+    },
+    "forest": {
+        'text_color': '#1B5E20',
+        'bg_color': '#F1F8E9',
+        'sidebar_bg': '#DCEDC8',
+        'editor_bg': '#F1F8E9'
+    }
+}
+
+# Language instruction for AI
+_LANG_INSTRUCTIONS = {
+    "english": "Respond in English.",
+    "bengali": "Respond in Bengali (বাংলা). Use Bengali script.",
+    "korean": "Respond in Korean (한국어). Use Korean script (Hangul)."
+}
+
+# Prompts for the AI assistant modes, filled in with str.format
+_PROMPT_TEMPLATES = {
+    "question": "{lang} Answer the following question or provide information about the following text:\n\n{text}",
+    "translate": "Translate the following text to {language}. If it's already in {language}, translate it to English:\n\n{text}",
+    "email": "{lang} Rephrase the following text as a professional, polite email. Use proper email format with greeting, body, and closing:\n\n{text}",
+    "improve": "{lang} Improve the following text by making it clearer, more concise, and better written. Fix any grammar or style issues:\n\n{text}",
+    "poetic": "{lang} Transform the following text into a poetic and creative version. Make it beautiful and artistic while preserving the core meaning:\n\n{text}",
+    "summarize": "{lang} Provide a concise summary of the following text, capturing the main points:\n\n{text}",
+    "explain": "{lang} Explain the following text in simple, easy-to-understand terms:\n\n{text}"
+}
 
 class NotesApp:
+    # Window-wide keyboard shortcuts as (event sequence, method name)
+    SHORTCUTS = [
+        # File operations
+        ('<Control-s>', 'on_save_note'),
+        ('<Control-n>', 'on_new_note'),
+        ('<Control-w>', 'on_new_note'),  # Alternative for new
+        ('<Control-d>', 'on_delete_note'),
+        ('<Control-q>', 'on_close'),
+        
+        # Search and navigation
+        ('<Control-f>', 'open_find_dialog'),
+        ('<Control-h>', 'open_find_dialog'),  # Alternative for find
+        
+        # Formatting
+        ('<Control-b>', 'toggle_bold'),
+        ('<Control-i>', 'toggle_italic'),
+        ('<Control-k>', 'insert_code_block'),
+        
+        # Tools
+        ('<Control-p>', 'open_code_preview'),
+        ('<Control-Shift-A>', 'open_ai_assistant'),
+        ('<Control-Shift-S>', 'open_settings'),
+        
+        # Help
+        ('<F1>', 'show_shortcuts_help'),
+        ('<Control-slash>', 'show_shortcuts_help'),
+        
+        # Utility
+        ('<Escape>', 'clear_selection'),
+    ]
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Notes")
@@ -22,16 +201,34 @@ class NotesApp:
         # Set minimum window size for usability
         self.root.minsize(600, 400)
         
-        # Set up the notes storage file
+        # Set up the notes storage: an index of note metadata plus one file
+        # per note holding its content (notes.json is the legacy single file)
         self.notes_dir = os.path.expanduser("~/.local/share/notes-app")
-        os.makedirs(self.notes_dir, exist_ok=True)
+        self.note_files_dir = os.path.join(self.notes_dir, "notes")
+        os.makedirs(self.note_files_dir, exist_ok=True)
+        self.index_file = os.path.join(self.notes_dir, "index.json")
         self.notes_file = os.path.join(self.notes_dir, "notes.json")
         self.config_file = os.path.join(self.notes_dir, "config.json")
         
-        # Initialize notes list
+        # Initialize notes list (content is loaded lazily by load_note)
         self.notes = self.load_notes()
         self.current_note_index = None
         
+        # Pending-save state: saves are coalesced and written off the UI thread
+        # by a single worker so snapshots always land on disk in order
+        self._dirty = False
+        self._changed_ids = set()
+        self._deleted_ids = set()
+        self._save_job = None
+        # Notes whose content file failed to read; saves never overwrite them
+        self._unreadable_ids = set()
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # AI requests share one daemon worker, which also keeps its Ollama
+        # connection warm and never holds up interpreter exit
+        self._ai_queue = queue.Queue()
+        threading.Thread(target=self.ai_worker, daemon=True).start()
+        
         # Load configuration (API keys, etc.)
         self.config = self.load_config()
         
@@ -62,7 +259,11 @@ class NotesApp:
         scaled_height = int(base_height * self.config['window_scale'])
         self.root.geometry(f"{scaled_width}x{scaled_height}")
         
-        # Check if Ollama is available
+        # Check if Ollama is available (the model list is cached, and each
+        # thread keeps its own kept-alive HTTP connection to the daemon)
+        self._ollama_models_cache = None
+        self._ollama_check_ts = None
+        self._ollama_local = threading.local()
         self.ollama_available = self.check_ollama()
         
         # Cat icon toggle state (True = pink, False = black)
@@ -94,12 +295,22 @@ class NotesApp:
         # Set custom cursor
         self.set_custom_cursor()
         
+        # Flush pending saves when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Bind window resize event
         self.root.bind('<Configure>', self.on_window_resize)
         
-        # Track last resize time for debouncing
-        self.last_resize_time = 0
+        # Track pending layout job, last seen and last laid-out root size
         self.resize_job = None
+        self._last_root_size = (0, 0)
+        self._applied_size = None
+        self._responsive_cache = OrderedDict()
+        
+        # Dialogs are built on first open, then hidden and shown again
+        self._find_dialog = None
+        self._ai_dialog = None
+        self._preview_dialog = None
         
         # Load first note if available
         if self.notes:
@@ -107,8 +318,6 @@ class NotesApp:
     
     def get_unicode_font(self):
         """Get a font that supports Unicode characters (Bengali, Korean, etc.)"""
-        import tkinter.font as tkfont
-        
         # On Linux, Tkinter may not see all system fonts
         # We'll use TkDefaultFont and configure it, or try common fonts
         
@@ -139,33 +348,33 @@ class NotesApp:
         try:
             # Load cursor image
             cursor_path = os.path.join(self.app_dir, "cursor.png")
-            if os.path.exists(cursor_path):
+            try:
                 self.cursor_img = Image.open(cursor_path)
-            else:
+                # Only the cursor's presence matters, so release the file handle
+                self.cursor_img.close()
+            except OSError:
                 self.cursor_img = None
             
-            # Load cat icons
-            cat_pink_path = os.path.join(self.app_dir, "cat_pink.png")
-            cat_black_path = os.path.join(self.app_dir, "cat_black.png")
-            
-            if os.path.exists(cat_pink_path):
-                self.cat_pink_img = ImageTk.PhotoImage(Image.open(cat_pink_path).resize((32, 32), Image.Resampling.LANCZOS))
-            else:
-                self.cat_pink_img = None
-            
-            if os.path.exists(cat_black_path):
-                self.cat_black_img = ImageTk.PhotoImage(Image.open(cat_black_path).resize((32, 32), Image.Resampling.LANCZOS))
-            else:
-                self.cat_black_img = None
+            # The cat icons are 1024px PNGs, so decode and scale them off the
+            # Tk thread; install_icons shows them once they are ready
+            self.cat_pink_img = None
+            self.cat_black_img = None
+            loader = ThreadPoolExecutor(max_workers=1)
+            self._icons_future = loader.submit(self.decode_icons)
+            loader.shutdown(wait=False)
+            self.root.after(20, self.install_icons)
             
             # Load background image
             bg_path = os.path.join(self.app_dir, "pink_bg.png")
-            if os.path.exists(bg_path):
-                # Open and resize to fit window
-                bg_image = Image.open(bg_path)
-                # Resize to cover the window
-                self.bg_img = ImageTk.PhotoImage(bg_image.resize((900, 600), Image.Resampling.LANCZOS))
-            else:
+            try:
+                # Decode once and keep the source in memory so resizes never hit the disk
+                with Image.open(bg_path) as bg_image:
+                    bg_image.load()
+                    self._bg_source = bg_image.convert('RGBA')
+                # Placeholder until the canvas is mapped and renders at its real size
+                self.bg_img = ImageTk.PhotoImage(self._bg_source.resize((900, 600), Image.Resampling.BILINEAR))
+            except OSError:
+                self._bg_source = None
                 self.bg_img = None
                 
         except Exception as e:
@@ -173,17 +382,58 @@ class NotesApp:
             self.cursor_img = None
             self.cat_pink_img = None
             self.cat_black_img = None
+            self._bg_source = None
             self.bg_img = None
     
+    def decode_icons(self):
+        """Decode and scale the cat icons (runs on a worker thread)"""
+        icons = {}
+        for name in ("cat_pink", "cat_black"):
+            try:
+                with Image.open(os.path.join(self.app_dir, f"{name}.png")) as cat_image:
+                    icons[name] = self.scale_icon(cat_image)
+            except OSError:
+                icons[name] = None
+        return icons
+    
+    def install_icons(self):
+        """Create Tk images for the decoded cat icons and show them"""
+        # Tk objects may only be touched from this thread, so poll the worker
+        if not self._icons_future.done():
+            self.root.after(20, self.install_icons)
+            return
+        
+        icons = self._icons_future.result()
+        if icons["cat_pink"] is not None:
+            self.cat_pink_img = ImageTk.PhotoImage(icons["cat_pink"])
+        if icons["cat_black"] is not None:
+            self.cat_black_img = ImageTk.PhotoImage(icons["cat_black"])
+        
+        icon = self.cat_pink_img if self.is_pink_cat else self.cat_black_img
+        if icon:
+            self.cat_button.config(image=icon)
+    
+    def scale_icon(self, image, size=32):
+        """Scale an icon image down to size x size pixels"""
+        if image.width == image.height and image.width % size == 0:
+            # Integer decimation skips the LANCZOS kernel convolution entirely
+            return image.reduce(image.width // size)
+        
+        # Otherwise decimate cheaply to within 2x of the target, then let
+        # LANCZOS polish the much smaller image
+        factor = min(image.width, image.height) // (size * 2)
+        if factor > 1:
+            image = image.reduce(factor)
+        return image.resize((size, size), Image.Resampling.LANCZOS)
+    
     def set_custom_cursor(self):
         """Set custom cursor for the application"""
         try:
+            # cursor_img is only set when load_assets found the file
             if self.cursor_img:
-                # Save cursor as temporary file for Tkinter
                 cursor_path = os.path.join(self.app_dir, "cursor.png")
-                if os.path.exists(cursor_path):
-                    # Tkinter requires cursor in specific format
-                    self.root.config(cursor=f"@{cursor_path}")
+                # Tkinter requires cursor in specific format
+                self.root.config(cursor=f"@{cursor_path}")
         except Exception as e:
             print(f"Error setting cursor: {e}")
     
@@ -203,6 +453,27 @@ class NotesApp:
         style.configure("Main.TFrame", background=bg_color)
         style.configure("TButton", padding=6, relief="flat", background=accent_color)
         style.map("TButton", background=[('active', '#357abd')])
+        
+        # Shared fonts: Tk resolves each one once, and reconfiguring a font
+        # updates every widget using it without touching the widgets
+        self.fonts = {
+            'body': tkfont.Font(family=self.config['font_family'], size=self.config['font_size']),
+            'hdr': tkfont.Font(family="Ubuntu", size=14, weight="bold"),
+            'entry': tkfont.Font(family="Ubuntu", size=11),
+            'ui': tkfont.Font(family="Ubuntu", size=10),
+            'ui_bold': tkfont.Font(family="Ubuntu", size=10, weight="bold"),
+            'section': tkfont.Font(family="Ubuntu", size=11, weight="bold"),
+            'small': tkfont.Font(family="Ubuntu", size=9),
+            'mono': tkfont.Font(family="Roboto Mono", size=10),
+            'code': tkfont.Font(family="Roboto Mono", size=11)
+        }
+        
+        # Dialog defaults, so dialog widgets only pass options that differ
+        dialog_bg = "#fff0f5"
+        for widget_class in ("Frame", "Label", "Labelframe", "Canvas", "Scale"):
+            self.root.option_add(f"*Toplevel*{widget_class}.background", dialog_bg)
+        self.root.option_add("*Toplevel*Label.font", self.fonts['ui'])
+        self.root.option_add("*Toplevel*Labelframe.font", self.fonts['section'])
     
     def create_ui(self):
         # Main container
@@ -214,20 +485,44 @@ class NotesApp:
             self.bg_canvas = tk.Canvas(main_container, width=900, height=600, highlightthickness=0)
             self.bg_canvas.pack(fill=tk.BOTH, expand=True)
             
-            # Bind resize event to update background
-            def on_resize(event):
-                # Resize background image to match canvas
-                if self.bg_img:
+            # A single canvas item shows the background; resizes swap its image
+            self._bg_item = self.bg_canvas.create_image(0, 0, image=self.bg_img, anchor=tk.NW, tags="bg")
+            
+            # Last size the background was rendered at with LANCZOS and pending resize job
+            self._bg_size = None
+            self._bg_resize_job = None
+            
+            def do_resize(width, height, final):
+                # Resize background image to match canvas: a cheap BILINEAR
+                # pass while dragging, LANCZOS once the size has settled
+                if final:
+                    self._bg_resize_job = None
+                # Nothing to do, not even a preview, at a size already rendered in full
+                if self._bg_source is not None and (width, height) != self._bg_size:
+                    self._bg_size = (width, height) if final else None
+                    resample = Image.Resampling.LANCZOS if final else Image.Resampling.BILINEAR
                     try:
-                        bg_image = Image.open(os.path.join(self.app_dir, "pink_bg.png"))
-                        resized_bg = bg_image.resize((event.width, event.height), Image.Resampling.LANCZOS)
-                        self.bg_img = ImageTk.PhotoImage(resized_bg)
-                        self.bg_canvas.delete("bg")
-                        self.bg_canvas.create_image(0, 0, image=self.bg_img, anchor=tk.NW, tags="bg")
-                        self.bg_canvas.tag_lower("bg")
+                        resized_bg = self._bg_source.resize((width, height), resample)
+                        new_bg = ImageTk.PhotoImage(resized_bg)
+                        # Tk holds its own copy of the pixels, so free the intermediate now
+                        resized_bg.close()
+                        self.bg_canvas.itemconfig(self._bg_item, image=new_bg)
+                        self.bg_canvas.tag_lower(self._bg_item)
+                        # Releasing the old PhotoImage frees its Tk image once nothing shows it
+                        self.bg_img = new_bg
                     except Exception as e:
                         print(f"Error resizing background: {e}")
             
+            # Bind resize event to update background
+            def on_resize(event):
+                # Debounce so a window drag only resamples the final geometry
+                if self._bg_resize_job:
+                    self.root.after_cancel(self._bg_resize_job)
+                else:
+                    # First event of a drag, show a quick preview right away
+                    do_resize(event.width, event.height, False)
+                self._bg_resize_job = self.root.after(75, lambda w=event.width, h=event.height: do_resize(w, h, True))
+            
             self.bg_canvas.bind('<Configure>', on_resize)
             
             # Create frames on canvas
@@ -254,7 +549,7 @@ class NotesApp:
                 self.bg_canvas.coords(self.editor_window, sidebar_width, 0)
                 self.bg_canvas.itemconfig(self.editor_window, width=canvas_width - sidebar_width, height=canvas_height)
             
-            self.bg_canvas.bind('<Configure>', lambda e: (on_resize(e), update_layout(e)), add='+')
+            self.bg_canvas.bind('<Configure>', update_layout, add='+')
             
         else:
             # Left sidebar for notes list
@@ -269,7 +564,7 @@ class NotesApp:
         header_frame = tk.Frame(sidebar_frame, bg="#ffe8f0")
         header_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        sidebar_label = tk.Label(header_frame, text="My Notes", font=("Ubuntu", 14, "bold"),
+        sidebar_label = tk.Label(header_frame, text="My Notes", font=self.fonts['hdr'],
                                  bg="#ffe8f0", fg="#333333")
         sidebar_label.pack(side=tk.LEFT)
         
@@ -295,7 +590,7 @@ class NotesApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.notes_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set,
-                                       font=("Ubuntu", 10), bg="white",
+                                       font=self.fonts['ui'], bg="white",
                                        selectmode=tk.SINGLE, relief=tk.FLAT,
                                        highlightthickness=0, borderwidth=0)
         self.notes_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -306,6 +601,8 @@ class NotesApp:
         # Add mousewheel scrolling support
         self.bind_mousewheel(self.notes_listbox)
         
+        # Titles currently shown in the listbox, used to diff refreshes
+        self._listbox_titles = []
         self.refresh_notes_list()
         
         # Right side - note editor (semi-transparent pink)
@@ -319,11 +616,11 @@ class NotesApp:
         title_row = tk.Frame(title_frame, bg="#fff0f5")
         title_row.pack(fill=tk.X, pady=(0, 5))
         
-        title_label = tk.Label(title_row, text="Title:", font=("Ubuntu", 10),
+        title_label = tk.Label(title_row, text="Title:", font=self.fonts['ui'],
                                bg="#fff0f5", fg="#333333")
         title_label.pack(side=tk.LEFT, padx=(0, 5))
         
-        self.title_entry = ttk.Entry(title_row, font=("Ubuntu", 11))
+        self.title_entry = ttk.Entry(title_row, font=self.fonts['entry'])
         self.title_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         
         # Buttons in a wrapping frame for responsiveness
@@ -365,7 +662,7 @@ class NotesApp:
         
         self.text_widget = scrolledtext.ScrolledText(
             text_frame,
-            font=(self.config['font_family'], self.config['font_size']),
+            font=self.fonts['body'],
             wrap=tk.WORD,
             undo=True,
             fg=self.config['text_color'],
@@ -381,38 +678,13 @@ class NotesApp:
         self.text_widget.pack(fill=tk.BOTH, expand=True)
         
         # Status bar
-        self.status_label = tk.Label(editor_frame, text="Ready", font=("Ubuntu", 9),
+        self.status_label = tk.Label(editor_frame, text="Ready", font=self.fonts['small'],
                                      bg="#fff0f5", fg="#666666")
         self.status_label.pack(fill=tk.X, pady=(5, 0))
         
         # Keyboard shortcuts
-        # File operations
-        self.root.bind('<Control-s>', lambda e: self.on_save_note())
-        self.root.bind('<Control-n>', lambda e: self.on_new_note())
-        self.root.bind('<Control-w>', lambda e: self.on_new_note())  # Alternative for new
-        self.root.bind('<Control-d>', lambda e: self.on_delete_note())
-        self.root.bind('<Control-q>', lambda e: self.root.quit())
-        
-        # Search and navigation
-        self.root.bind('<Control-f>', lambda e: self.open_find_dialog())
-        self.root.bind('<Control-h>', lambda e: self.open_find_dialog())  # Alternative for find
-        
-        # Formatting
-        self.root.bind('<Control-b>', lambda e: self.toggle_bold())
-        self.root.bind('<Control-i>', lambda e: self.toggle_italic())
-        self.root.bind('<Control-k>', lambda e: self.insert_code_block())
-        
-        # Tools
-        self.root.bind('<Control-p>', lambda e: self.open_code_preview())
-        self.root.bind('<Control-Shift-A>', lambda e: self.open_ai_assistant())
-        self.root.bind('<Control-Shift-S>', lambda e: self.open_settings())
-        
-        # Help
-        self.root.bind('<F1>', lambda e: self.show_shortcuts_help())
-        self.root.bind('<Control-slash>', lambda e: self.show_shortcuts_help())
-        
-        # Utility
-        self.root.bind('<Escape>', lambda e: self.text_widget.tag_remove(tk.SEL, "1.0", tk.END))
+        for sequence, method_name in self.SHORTCUTS:
+            self.root.bind(sequence, lambda e, method=getattr(self, method_name): method())
         
         # Text widget specific bindings (some may not work by default on Linux)
         self.text_widget.bind('<Control-a>', self.select_all)
@@ -423,11 +695,28 @@ class NotesApp:
 
     
     def refresh_notes_list(self):
-        """Refresh the notes list display"""
-        self.notes_listbox.delete(0, tk.END)
-        for note in self.notes:
-            title = note.get("title", "Untitled")
-            self.notes_listbox.insert(tk.END, f"  {title}")
+        """Refresh the notes list display, touching only the rows that changed"""
+        titles = [f"  {note.get('title', 'Untitled')}" for note in self.notes]
+        shown = self._listbox_titles
+        
+        # Skip the unchanged head and tail, then replace the differing middle
+        start = 0
+        limit = min(len(shown), len(titles))
+        while start < limit and shown[start] == titles[start]:
+            start += 1
+        
+        shown_end = len(shown)
+        titles_end = len(titles)
+        while shown_end > start and titles_end > start and shown[shown_end - 1] == titles[titles_end - 1]:
+            shown_end -= 1
+            titles_end -= 1
+        
+        if shown_end > start:
+            self.notes_listbox.delete(start, shown_end - 1)
+        if titles_end > start:
+            self.notes_listbox.insert(start, *titles[start:titles_end])
+        
+        self._listbox_titles = titles
     
     def on_note_selected(self, event):
         """Handle note selection from list"""
@@ -441,14 +730,26 @@ class NotesApp:
         if 0 <= index < len(self.notes):
             self.current_note_index = index
             note = self.notes[index]
+            if "content" not in note:
+                content = self.read_note_content(note["id"])
+                if content is None:
+                    self._unreadable_ids.add(note["id"])
+                else:
+                    self._unreadable_ids.discard(note["id"])
+                    note["content"] = content
             
             self.title_entry.delete(0, tk.END)
             self.title_entry.insert(0, note.get("title", ""))
             
             self.text_widget.delete("1.0", tk.END)
             self.text_widget.insert("1.0", note.get("content", ""))
+            # Track edits from here so saving can skip an unchanged buffer
+            self.text_widget.edit_modified(False)
             
-            self.status_label.config(text=f"Loaded: {note.get('title', 'Untitled')}")
+            if note["id"] in self._unreadable_ids:
+                self.status_label.config(text=f"Could not read: {note.get('title', 'Untitled')}")
+            else:
+                self.status_label.config(text=f"Loaded: {note.get('title', 'Untitled')}")
             
             # Select in listbox
             self.notes_listbox.selection_clear(0, tk.END)
@@ -457,30 +758,49 @@ class NotesApp:
     
     def on_new_note(self):
         """Create a new note"""
+        timestamp = datetime.now().isoformat()
         new_note = {
+            "id": uuid.uuid4().hex,
             "title": "New Note",
             "content": "",
-            "created": datetime.now().isoformat(),
-            "modified": datetime.now().isoformat()
+            "created": timestamp,
+            "modified": timestamp
         }
         self.notes.append(new_note)
-        self.save_notes()
+        self.schedule_save(changed=new_note["id"])
         self.refresh_notes_list()
         self.load_note(len(self.notes) - 1)
     
     def on_save_note(self):
         """Save the current note"""
         if self.current_note_index is not None:
+            note = self.notes[self.current_note_index]
             title = self.title_entry.get().strip()
-            content = self.text_widget.get("1.0", tk.END).strip()
             
-            self.notes[self.current_note_index]["title"] = title if title else "Untitled"
-            self.notes[self.current_note_index]["content"] = content
-            self.notes[self.current_note_index]["modified"] = datetime.now().isoformat()
+            # Only copy the text buffer out of Tk if it was edited since load/save,
+            # and never for a note whose file could not be read
+            if note["id"] in self._unreadable_ids:
+                content = None
+            elif self.text_widget.edit_modified():
+                content = self.text_widget.get("1.0", tk.END).strip()
+            else:
+                content = note.get("content", "")
             
-            self.save_notes()
-            self.refresh_notes_list()
-            self.status_label.config(text=f"Saved: {title if title else 'Untitled'}")
+            new_title = title if title else "Untitled"
+            if new_title != note.get("title") or content != note.get("content"):
+                note["title"] = new_title
+                if content is not None:
+                    note["content"] = content
+                note["modified"] = datetime.now().isoformat()
+                
+                self.schedule_save(changed=note["id"])
+                self.refresh_notes_list()
+            if content is None and self.text_widget.edit_modified():
+                # Keep the edit marked as unsaved rather than dropping it quietly
+                self.status_label.config(text=f"Not saved: could not read {new_title}")
+            else:
+                self.text_widget.edit_modified(False)
+                self.status_label.config(text=f"Saved: {new_title}")
             
             # Re-select current note
             self.notes_listbox.selection_clear(0, tk.END)
@@ -496,9 +816,9 @@ class NotesApp:
             )
             
             if result:
-                deleted_title = self.notes[self.current_note_index].get("title", "Untitled")
-                del self.notes[self.current_note_index]
-                self.save_notes()
+                deleted = self.notes.pop(self.current_note_index)
+                deleted_title = deleted.get("title", "Untitled")
+                self.schedule_save(deleted=deleted["id"])
                 self.refresh_notes_list()
                 
                 # Load another note or clear
@@ -513,24 +833,182 @@ class NotesApp:
                 self.status_label.config(text=f"Deleted: {deleted_title}")
     
     def load_notes(self):
-        """Load notes from JSON file"""
-        if os.path.exists(self.notes_file):
+        """Load note metadata from the index file"""
+        try:
+            notes = read_json(self.index_file)
+        except FileNotFoundError:
+            notes = self.migrate_notes_file()
+        except Exception as e:
+            print(f"Error loading notes: {e}")
+            notes = []
+        return self.recover_orphan_notes(notes)
+    
+    def recover_orphan_notes(self, notes):
+        """Add note files missing from the index, e.g. after a crash between
+        writing a new note and writing the index, or a corrupt index"""
+        known_ids = {note["id"] for note in notes}
+        try:
+            # DirEntry carries the name and type, so this is one syscall per
+            # batch of entries rather than a stat per file
+            with os.scandir(self.note_files_dir) as entries:
+                orphan_ids = [
+                    entry.name[:-len(".json")] for entry in entries
+                    if entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                    and entry.name[:-len(".json")] not in known_ids
+                ]
+        except OSError as e:
+            print(f"Error scanning notes: {e}")
+            return notes
+        
+        now = datetime.now().isoformat()
+        for note_id in sorted(orphan_ids):
             try:
-                with open(self.notes_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                record = read_json(self.note_path(note_id))
+                if not isinstance(record, dict):
+                    raise ValueError(f"{note_id}.json is not a note")
             except Exception as e:
-                print(f"Error loading notes: {e}")
-                return []
-        return []
+                print(f"Error loading note: {e}")
+                record = {}
+            # Files from before notes kept their metadata only have content,
+            # so fall back to its first line for the title
+            title = record.get("title") or record.get("content", "").strip().partition("\n")[0].strip()
+            notes.append({
+                "id": note_id,
+                "title": title or "Recovered Note",
+                "created": record.get("created") or now,
+                "modified": record.get("modified") or now
+            })
+        return notes
     
-    def save_notes(self):
-        """Save notes to JSON file"""
+    def migrate_notes_file(self):
+        """Split a legacy notes.json into the index and one file per note"""
         try:
-            with open(self.notes_file, 'w', encoding='utf-8') as f:
-                json.dump(self.notes, f, indent=2, ensure_ascii=False)
+            notes = read_json(self.notes_file)
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            print(f"Error saving notes: {e}")
-            self.status_label.config(text=f"Error saving: {e}")
+            print(f"Error loading notes: {e}")
+            return []
+        
+        for note in notes:
+            note["id"] = uuid.uuid4().hex
+        try:
+            self.write_notes(notes, {note["id"]: self.note_record(note) for note in notes}, ())
+            # Keep the old file around as a backup rather than deleting it
+            os.replace(self.notes_file, self.notes_file + ".bak")
+        except Exception as e:
+            print(f"Error migrating notes: {e}")
+        return notes
+    
+    def note_path(self, note_id):
+        """Path of the file holding a single note's content"""
+        return os.path.join(self.note_files_dir, f"{note_id}.json")
+    
+    def note_record(self, note):
+        """What a note's own file holds: its content plus enough metadata
+        for recover_orphan_notes to rebuild its index entry"""
+        return {key: note.get(key, "") for key in ("title", "created", "modified", "content")}
+    
+    def read_note_content(self, note_id):
+        """Read a single note's content from its own file, or None if the
+        file exists but cannot be read"""
+        try:
+            return read_json(self.note_path(note_id)).get("content", "")
+        except FileNotFoundError:
+            return ""
+        except Exception as e:
+            print(f"Error loading note: {e}")
+            return None
+    
+    def schedule_save(self, changed=None, deleted=None):
+        """Mark notes dirty and coalesce rapid saves into one disk write"""
+        self._dirty = True
+        if changed is not None:
+            self._changed_ids.add(changed)
+        if deleted is not None:
+            self._deleted_ids.add(deleted)
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(500, self.flush_notes)
+    
+    def take_pending_save(self):
+        """Snapshot pending note changes as write_notes arguments, or None"""
+        if not self._dirty:
+            return None
+        # Snapshot on the UI thread so the writer never sees a half-edited list
+        changed = {
+            note["id"]: self.note_record(note)
+            for note in self.notes
+            if note["id"] in self._changed_ids and note["id"] not in self._unreadable_ids
+        }
+        snapshot = [dict(note) for note in self.notes]
+        deleted = tuple(self._deleted_ids)
+        self._dirty = False
+        self._changed_ids = set()
+        self._deleted_ids = set()
+        return snapshot, changed, deleted
+    
+    def flush_notes(self):
+        """Hand pending note changes to the background writer"""
+        self._save_job = None
+        pending = self.take_pending_save()
+        if pending is None:
+            return
+        _, changed, deleted = pending
+        future = self._save_executor.submit(self.write_notes, *pending)
+        self.root.after(50, self.check_save, future, tuple(changed), deleted)
+    
+    def check_save(self, future, changed, deleted):
+        """Report the outcome of a background save, and queue its notes
+        again if it failed so a later save still writes them"""
+        # The writer never touches Tk, so poll it from this thread
+        if not future.done():
+            self.root.after(50, self.check_save, future, changed, deleted)
+            return
+        
+        error = future.exception()
+        if error is not None:
+            print(f"Error saving notes: {error}")
+            self.status_label.config(text=f"Error saving: {error}")
+            self._changed_ids.update(changed)
+            self._deleted_ids.update(deleted)
+            self._dirty = True
+            # Retry on a slower timer so a persistent error does not spin
+            if not self._save_job:
+                self._save_job = self.root.after(5000, self.flush_notes)
+    
+    def write_notes(self, notes, changed, deleted):
+        """Write note files first and the index last, so the index never
+        points at content that has not reached the disk yet"""
+        for note_id, record in changed.items():
+            self.write_json(self.note_path(note_id), record, compact=True)
+        
+        # The index is rewritten on every save, so skip pretty-printing
+        index = [{key: value for key, value in note.items() if key != "content"} for note in notes]
+        self.write_json(self.index_file, index, compact=True)
+        
+        for note_id in deleted:
+            try:
+                os.remove(self.note_path(note_id))
+            except FileNotFoundError:
+                pass
+    
+    def on_close(self):
+        """Write any pending changes to disk, then quit"""
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        
+        # Let queued background saves land first, then write the last
+        # changes here so nothing is left waiting on the event loop
+        self._save_executor.shutdown(wait=True)
+        pending = self.take_pending_save()
+        if pending is not None:
+            try:
+                self.write_notes(*pending)
+            except Exception as e:
+                print(f"Error saving notes: {e}")
+        self.root.destroy()
     
     def toggle_cat_icon(self):
         """Toggle between pink and black cat icons"""
@@ -545,65 +1023,102 @@ class NotesApp:
     
     def load_config(self):
         """Load configuration from JSON file"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading config: {e}")
-                return {}
-        return {}
+        try:
+            return read_json(self.config_file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            return {}
     
     def save_config(self):
         """Save configuration to JSON file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.write_json(self.config_file, self.config)
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def write_json(self, path, data, compact=False):
+        """Write data as JSON in a single buffered write, then atomically replace path"""
+        encoded = dump_json(data, compact)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb', buffering=65536) as f:
+            f.write(encoded)
+        os.replace(tmp_path, path)
+    
     def setup_gemini(self):
         """Initialize local AI model (Ollama)"""
         # This method is kept for compatibility
         pass
     
-    def check_ollama(self):
-        """Check if Ollama is installed and running"""
-        try:
-            result = subprocess.run(
-                ['ollama', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+    def ollama_request(self, method, path, payload=None, timeout=30):
+        """Call the Ollama HTTP API and return (status, decoded JSON reply).
+        
+        Raises OSError if the daemon cannot be reached.
+        """
+        body = None
+        headers = {}
+        if payload is not None:
+            body = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        
+        # The server may have closed an idle kept-alive connection, so a
+        # failure on a reused connection is retried once on a fresh one
+        for attempt in range(2):
+            conn = getattr(self._ollama_local, 'conn', None)
+            reused = conn is not None
+            if not reused:
+                conn = http.client.HTTPConnection(OLLAMA_HOST, timeout=timeout)
+                self._ollama_local.conn = conn
+            try:
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                self._ollama_local.conn = None
+                if reused and not isinstance(e, TimeoutError):
+                    continue
+                raise
+            return response.status, json.loads(data) if data else {}
     
-    def get_available_models(self):
-        """Get list of available Ollama models"""
+    def list_ollama_models(self):
+        """Return installed Ollama model names, or None if Ollama is unavailable.
+        
+        The result is cached for 30 seconds and shared by
+        check_ollama/get_available_models.
+        """
+        now = time.monotonic()
+        if self._ollama_check_ts is not None and now - self._ollama_check_ts < 30:
+            return self._ollama_models_cache
+        
         try:
-            result = subprocess.run(
-                ['ollama', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            status, reply = self.ollama_request('GET', '/api/tags', timeout=5)
             
-            if result.returncode == 0:
-                # Parse model names from output
-                lines = result.stdout.strip().split('\n')
-                models = []
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        model_name = line.split()[0]
-                        models.append(model_name)
-                return models if models else ['qwen2.5:0.5b']
+            if status == 200:
+                models = [model['name'] for model in reply.get('models', [])]
             else:
-                return ['qwen2.5:0.5b']
+                models = None
+        except OSError:
+            models = None
         except Exception as e:
             print(f"Error getting models: {e}")
-            return ['qwen2.5:0.5b']
+            models = None
+        
+        self._ollama_models_cache = models
+        self._ollama_check_ts = now
+        return models
+    
+    def check_ollama(self):
+        """Check if Ollama is installed and running"""
+        return self.list_ollama_models() is not None
+    
+    def get_available_models(self):
+        """Get list of available Ollama models"""
+        models = self.list_ollama_models()
+        return models if models else ['qwen2.5:0.5b']
     
     def generate_text_ollama(self, prompt, max_tokens=300, model=None):
         """Generate text using Ollama"""
@@ -611,27 +1126,43 @@ class NotesApp:
             model = self.config.get('ai_model', 'qwen2.5:0.5b')
         
         try:
-            # Use subprocess to call ollama
-            result = subprocess.run(
-                ['ollama', 'run', model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            status, reply = self.ollama_request('POST', '/api/generate', {
+                'model': model,
+                'prompt': prompt,
+                'stream': False,
+                'options': {'num_predict': max_tokens}
+            }, timeout=30)
             
-            if result.returncode == 0:
-                return result.stdout.strip()
+            if status == 200:
+                return reply.get('response', '').strip()
             else:
-                print(f"Ollama error: {result.stderr}")
+                print(f"Ollama error: {reply.get('error', status)}")
                 return None
                 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Ollama timeout")
             return None
         except Exception as e:
             print(f"Error calling Ollama: {e}")
             return None
     
+    def submit_ai(self, prompt, max_tokens=300, model=None):
+        """Queue a generate_text_ollama call for the AI worker thread"""
+        future = Future()
+        self._ai_queue.put((future, prompt, max_tokens, model))
+        return future
+    
+    def ai_worker(self):
+        """Run queued AI requests one at a time, off the Tk thread"""
+        while True:
+            future, *args = self._ai_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.generate_text_ollama(*args))
+            except Exception as e:
+                future.set_exception(e)
+    
     def open_ai_assistant(self):
         """Open AI Assistant dialog"""
         if not self.ollama_available:
@@ -643,8 +1174,11 @@ class NotesApp:
             )
             return
         
-        # Show AI Assistant dialog
-        AIAssistantDialog(self.root, self)
+        # Show AI Assistant dialog, reusing the one built on first open
+        if self._ai_dialog is not None and self._ai_dialog.dialog.winfo_exists():
+            self._ai_dialog.show()
+        else:
+            self._ai_dialog = AIAssistantDialog(self.root, self)
     
     def open_settings(self):
         """Open settings dialog"""
@@ -694,56 +1228,42 @@ class NotesApp:
         self.text_widget.see(tk.INSERT)
         return 'break'  # Prevent default behavior
     
+    def clear_selection(self):
+        """Clear the text selection in the editor"""
+        self.text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+    
     def open_find_dialog(self):
         """Open find and replace dialog"""
-        FindDialog(self.root, self)
+        if self._find_dialog is not None and self._find_dialog.dialog.winfo_exists():
+            self._find_dialog.show()
+        else:
+            self._find_dialog = FindDialog(self.root, self)
     
     def open_code_preview(self):
         """Open code block preview dialog"""
-        CodeBlockPreviewDialog(self.root, self)
+        if self._preview_dialog is not None and self._preview_dialog.dialog.winfo_exists():
+            self._preview_dialog.show()
+        else:
+            self._preview_dialog = CodeBlockPreviewDialog(self.root, self)
     
     def show_shortcuts_help(self):
         """Show keyboard shortcuts help dialog"""
         help_dialog = tk.Toplevel(self.root)
         help_dialog.title("⌨️ Keyboard Shortcuts")
-        help_dialog.geometry("600x500")
         help_dialog.transient(self.root)
         help_dialog.grab_set()
         
-        # Center the dialog
-        help_dialog.update_idletasks()
-        x = (help_dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (help_dialog.winfo_screenheight() // 2) - (500 // 2)
-        help_dialog.geometry(f"600x500+{x}+{y}")
-        
-        main_frame = tk.Frame(help_dialog, bg="#fff0f5", padx=20, pady=20)
+        main_frame = tk.Frame(help_dialog, padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
         title_label = tk.Label(
             main_frame,
             text="⌨️ Keyboard Shortcuts",
-            font=("Ubuntu", 14, "bold"),
-            bg="#fff0f5"
+            font=self.fonts['hdr']
         )
         title_label.pack(pady=(0, 15))
         
-        # Create scrollable frame
-        canvas = tk.Canvas(main_frame, bg="#fff0f5", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#fff0f5")
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
         # Shortcuts data
         shortcuts = [
             ("📁 File Operations", [
@@ -779,45 +1299,33 @@ class NotesApp:
             ]),
         ]
         
-        # Display shortcuts
+        # Display shortcuts as tagged lines in a single read-only text widget
+        shortcut_font = ("Roboto Mono", 10, "bold")
+        key_width = tkfont.Font(font=shortcut_font).measure("0" * 20) + 10
+        
+        shortcuts_text = scrolledtext.ScrolledText(
+            main_frame,
+            bg="#fff0f5",
+            relief=tk.FLAT,
+            highlightthickness=0,
+            wrap=tk.WORD,
+            height=10,
+            tabs=(key_width + 10,),
+            cursor="arrow"
+        )
+        shortcuts_text.pack(fill=tk.BOTH, expand=True)
+        
+        shortcuts_text.tag_configure("category", font=self.fonts['section'], foreground="#333333",
+                                     spacing1=10, spacing3=5)
+        shortcuts_text.tag_configure("shortcut", font=shortcut_font, foreground="#333333",
+                                     background="#ffe8f0", spacing1=2, spacing3=2)
+        shortcuts_text.tag_configure("desc", font=self.fonts['ui'], foreground="#666666")
+        
         for category, items in shortcuts:
-            # Category header
-            category_label = tk.Label(
-                scrollable_frame,
-                text=category,
-                font=("Ubuntu", 11, "bold"),
-                bg="#fff0f5",
-                fg="#333333"
-            )
-            category_label.pack(anchor=tk.W, pady=(10, 5))
-            
-            # Shortcuts in this category
+            shortcuts_text.insert(tk.END, category + "\n", "category")
             for shortcut, description in items:
-                shortcut_frame = tk.Frame(scrollable_frame, bg="#fff0f5")
-                shortcut_frame.pack(fill=tk.X, pady=2)
-                
-                shortcut_label = tk.Label(
-                    shortcut_frame,
-                    text=shortcut,
-                    font=("Roboto Mono", 10, "bold"),
-                    bg="#ffe8f0",
-                    fg="#333333",
-                    width=20,
-                    anchor=tk.W,
-                    padx=5,
-                    pady=2
-                )
-                shortcut_label.pack(side=tk.LEFT, padx=(0, 10))
-                
-                desc_label = tk.Label(
-                    shortcut_frame,
-                    text=description,
-                    font=("Ubuntu", 10),
-                    bg="#fff0f5",
-                    fg="#666666",
-                    anchor=tk.W
-                )
-                desc_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                shortcuts_text.insert(tk.END, shortcut, "shortcut", "\t" + description + "\n", "desc")
+        shortcuts_text.config(state=tk.DISABLED)
         
         # Close button
         close_button = ttk.Button(
@@ -826,36 +1334,44 @@ class NotesApp:
             command=help_dialog.destroy
         )
         close_button.pack(pady=(15, 0))
+        
+        # Size and center the dialog in one geometry call, once it is built
+        x = (help_dialog.winfo_screenwidth() // 2) - (600 // 2)
+        y = (help_dialog.winfo_screenheight() // 2) - (500 // 2)
+        help_dialog.geometry(f"600x500+{x}+{y}")
     
     def on_window_resize(self, event):
         """Handle window resize events with debouncing"""
-        # Only process resize events for the root window
-        if event.widget != self.root:
+        # Only process resize events for the root window, and ignore
+        # Configure events (e.g. moves) that leave its size unchanged
+        if event.widget is not self.root:
             return
+        if (event.width, event.height) == self._last_root_size:
+            return
+        self._last_root_size = (event.width, event.height)
         
-        # Debounce resize events to avoid excessive processing
-        import time
-        current_time = time.time()
-        
-        # Cancel previous resize job if exists
+        # Debounce resize events to avoid excessive processing:
+        # cancel previous resize job if exists
         if self.resize_job:
             self.root.after_cancel(self.resize_job)
         
-        # Schedule new resize job after 100ms delay
-        self.resize_job = self.root.after(100, self.apply_responsive_layout)
-        self.last_resize_time = current_time
+        # Schedule new resize job after 80ms delay
+        self.resize_job = self.root.after(80, self.apply_responsive_layout)
     
     def apply_responsive_layout(self):
         """Apply responsive layout adjustments based on current window size"""
+        self.resize_job = None
         try:
             window_width = self.root.winfo_width()
             window_height = self.root.winfo_height()
             
-            # Calculate responsive sidebar width (20-30% of window width)
-            min_sidebar = 150
-            max_sidebar = 400
-            responsive_sidebar = int(window_width * 0.25)
-            new_sidebar_width = max(min_sidebar, min(max_sidebar, responsive_sidebar))
+            # Each itemconfig below triggers a Tk re-layout, so skip sizes
+            # that have already been laid out
+            if (window_width, window_height) == self._applied_size:
+                return
+            self._applied_size = (window_width, window_height)
+            
+            new_sidebar_width = self.calculate_responsive_sizes(window_width, window_height)['sidebar_width']
             
             # Update sidebar width if using canvas layout
             if hasattr(self, 'bg_canvas') and hasattr(self, 'sidebar_window'):
@@ -866,10 +1382,19 @@ class NotesApp:
         except Exception as e:
             print(f"Error in responsive layout: {e}")
     
-    def calculate_responsive_sizes(self):
+    def calculate_responsive_sizes(self, window_width=None, window_height=None):
         """Calculate responsive sizes for UI elements based on window dimensions"""
-        window_width = self.root.winfo_width()
-        window_height = self.root.winfo_height()
+        if window_width is None:
+            window_width = self.root.winfo_width()
+        if window_height is None:
+            window_height = self.root.winfo_height()
+        
+        # Drag-resizing revisits the same sizes, so keep a small LRU of results
+        key = (window_width, window_height)
+        cached = self._responsive_cache.get(key)
+        if cached is not None:
+            self._responsive_cache.move_to_end(key)
+            return cached
         
         # Calculate button sizes
         if window_width < 700:
@@ -882,30 +1407,28 @@ class NotesApp:
             button_width = 12
             button_padding = 2
         
-        return {
+        # Calculate responsive sidebar width (25% of window width, 150-400px)
+        sidebar_width = max(150, min(400, int(window_width * 0.25)))
+        
+        sizes = {
             'button_width': button_width,
             'button_padding': button_padding,
-            'sidebar_width': int(window_width * 0.25),
+            'sidebar_width': sidebar_width,
             'font_scale': 1.0 if window_width >= 800 else 0.9
         }
+        
+        self._responsive_cache[key] = sizes
+        if len(self._responsive_cache) > 32:
+            self._responsive_cache.popitem(last=False)
+        return sizes
     
     def bind_mousewheel(self, widget):
         """Bind mousewheel scrolling to a widget"""
-        def on_mousewheel(event):
-            # Linux uses event.num to distinguish scroll direction
-            if event.num == 4:  # Scroll up
-                widget.yview_scroll(-1, "units")
-            elif event.num == 5:  # Scroll down
-                widget.yview_scroll(1, "units")
-            # Windows and macOS use event.delta
-            elif hasattr(event, 'delta'):
-                widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
         # Bind for Linux
-        widget.bind("<Button-4>", on_mousewheel)
-        widget.bind("<Button-5>", on_mousewheel)
+        widget.bind("<Button-4>", _mousewheel_dispatch)
+        widget.bind("<Button-5>", _mousewheel_dispatch)
         # Bind for Windows and macOS
-        widget.bind("<MouseWheel>", on_mousewheel)
+        widget.bind("<MouseWheel>", _mousewheel_dispatch)
 
 
 class AIAssistantDialog:
@@ -913,6 +1436,10 @@ class AIAssistantDialog:
         self.notes_app = notes_app
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("✨ AI Writing Assistant")
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # AI request whose result the dialog is waiting for
+        self._pending = None
         
         # Calculate responsive dialog size (80% of parent window)
         parent_width = parent.winfo_width()
@@ -920,101 +1447,78 @@ class AIAssistantDialog:
         dialog_width = min(700, int(parent_width * 0.8))
         dialog_height = min(650, int(parent_height * 0.85))
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
+        self.create_ui()
+        
+        # Size and center the dialog in one geometry call, once it is built
         x = (self.dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (dialog_height // 2)
         self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-        
-        self.create_ui()
     
     def create_ui(self):
-        main_frame = tk.Frame(self.dialog, bg="#fff0f5", padx=15, pady=15)
+        main_frame = tk.Frame(self.dialog, padx=15, pady=15)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
         title_label = tk.Label(
             main_frame,
             text="AI Writing Assistant",
-            font=("Ubuntu", 14, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['hdr']
         )
         title_label.pack(pady=(0, 10))
         
         # Settings Frame (Model and Language Selection)
-        settings_frame = tk.LabelFrame(main_frame, text="AI Settings", bg="#fff0f5", font=("Ubuntu", 10, "bold"), padx=10, pady=10)
+        settings_frame = tk.LabelFrame(main_frame, text="AI Settings", font=self.notes_app.fonts['ui_bold'], padx=10, pady=10)
         settings_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Model Selection
-        model_label = tk.Label(settings_frame, text="Model:", bg="#fff0f5", font=("Ubuntu", 9))
+        model_label = tk.Label(settings_frame, text="Model:", font=self.notes_app.fonts['small'])
         model_label.grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         
-        available_models = self.notes_app.get_available_models()
-        self.model_var = tk.StringVar(value=self.notes_app.config.get('ai_model', 'qwen2.5:0.5b'))
-        model_dropdown = ttk.Combobox(settings_frame, textvariable=self.model_var, values=available_models, state="readonly", width=25)
-        model_dropdown.grid(row=0, column=1, sticky=tk.W, padx=5)
+        self.model_var = tk.StringVar()
+        self.model_dropdown = ttk.Combobox(settings_frame, textvariable=self.model_var, state="readonly", width=25)
+        self.model_dropdown.grid(row=0, column=1, sticky=tk.W, padx=5)
         
         # Language Selection
-        lang_label = tk.Label(settings_frame, text="Output Language:", bg="#fff0f5", font=("Ubuntu", 9))
+        lang_label = tk.Label(settings_frame, text="Output Language:", font=self.notes_app.fonts['small'])
         lang_label.grid(row=0, column=2, sticky=tk.W, padx=(15, 5))
         
-        languages = [
-            ("English", "english"),
-            ("বাংলা (Bengali)", "bengali"),
-            ("한국어 (Korean)", "korean")
-        ]
-        self.language_var = tk.StringVar(value=self.notes_app.config.get('language', 'english'))
+        self.language_var = tk.StringVar()
         lang_dropdown = ttk.Combobox(settings_frame, textvariable=self.language_var, 
-                                     values=[lang[0] for lang in languages], state="readonly", width=20)
+                                     values=_LANG_DISPLAY, state="readonly", width=20)
         lang_dropdown.grid(row=0, column=3, sticky=tk.W, padx=5)
         
-        # Map display names to internal values
-        self.lang_map = {lang[0]: lang[1] for lang in languages}
-        self.lang_reverse_map = {lang[1]: lang[0] for lang in languages}
-        lang_dropdown.set(self.lang_reverse_map.get(self.language_var.get(), "English"))
-        
         # Input text area
         input_label = tk.Label(
             main_frame,
             text="Your Text:",
-            font=("Ubuntu", 10, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['ui_bold']
         )
         input_label.pack(anchor=tk.W)
         
-        # Get selected text or entire note content
-        try:
-            selected_text = self.notes_app.text_widget.get(tk.SEL_FIRST, tk.SEL_LAST)
-        except tk.TclError:
-            selected_text = self.notes_app.text_widget.get("1.0", tk.END).strip()
-        
         self.input_text = scrolledtext.ScrolledText(
             main_frame,
-            font=("Roboto Mono", 10),
+            font=self.notes_app.fonts['mono'],
             height=6,
             wrap=tk.WORD
         )
         self.input_text.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
-        self.input_text.insert("1.0", selected_text)
         
         # Transformation options
         options_label = tk.Label(
             main_frame,
             text="Choose Transformation:",
-            font=("Ubuntu", 10, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['ui_bold']
         )
         options_label.pack(anchor=tk.W, pady=(5, 5))
         
         # Button frames (2 rows)
-        button_frame1 = tk.Frame(main_frame, bg="#fff0f5")
+        button_frame1 = tk.Frame(main_frame)
         button_frame1.pack(fill=tk.X, pady=(0, 5))
         
-        button_frame2 = tk.Frame(main_frame, bg="#fff0f5")
+        button_frame2 = tk.Frame(main_frame)
         button_frame2.pack(fill=tk.X, pady=(0, 10))
         
         # Row 1 buttons
@@ -1065,14 +1569,13 @@ class AIAssistantDialog:
         output_label = tk.Label(
             main_frame,
             text="AI Result:",
-            font=("Ubuntu", 10, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['ui_bold']
         )
         output_label.pack(anchor=tk.W, pady=(5, 5))
         
         self.output_text = scrolledtext.ScrolledText(
             main_frame,
-            font=("Roboto Mono", 10),
+            font=self.notes_app.fonts['mono'],
             height=6,
             wrap=tk.WORD
         )
@@ -1082,14 +1585,13 @@ class AIAssistantDialog:
         self.status_label = tk.Label(
             main_frame,
             text="Ready",
-            font=("Ubuntu", 9),
-            bg="#fff0f5",
+            font=self.notes_app.fonts['small'],
             fg="#666666"
         )
         self.status_label.pack(anchor=tk.W, pady=(5, 10))
         
         # Action buttons
-        action_frame = tk.Frame(main_frame, bg="#fff0f5")
+        action_frame = tk.Frame(main_frame)
         action_frame.pack()
         
         ttk.Button(
@@ -1101,8 +1603,50 @@ class AIAssistantDialog:
         ttk.Button(
             action_frame,
             text="Close",
-            command=self.dialog.destroy
+            command=self.hide
         ).pack(side=tk.LEFT, padx=5)
+        
+        self.load_current()
+    
+    def load_current(self):
+        """Fill the dialog from the current note and AI settings"""
+        self.model_dropdown['values'] = self.notes_app.get_available_models()
+        self.model_var.set(self.notes_app.config.get('ai_model', 'qwen2.5:0.5b'))
+        # Map internal values to display names
+        self.language_var.set(_LANG_REVERSE.get(self.notes_app.config.get('language', 'english'), "English"))
+        
+        # Get selected text or entire note content
+        try:
+            selected_text = self.notes_app.text_widget.get(tk.SEL_FIRST, tk.SEL_LAST)
+        except tk.TclError:
+            selected_text = self.notes_app.text_widget.get("1.0", tk.END).strip()
+        
+        self.drop_pending()
+        self.input_text.delete("1.0", tk.END)
+        self.input_text.insert("1.0", selected_text)
+        self.output_text.delete("1.0", tk.END)
+        self.status_label.config(text="Ready")
+    
+    def show(self):
+        """Show the dialog again after it was hidden"""
+        self.load_current()
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+        self.input_text.focus_set()
+    
+    def hide(self):
+        """Hide the dialog so the next open can reuse it"""
+        self.drop_pending()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
+    def drop_pending(self):
+        """Forget the AI request in flight so its result is never shown"""
+        if self._pending is not None:
+            # Still queued requests never reach Ollama
+            self._pending.cancel()
+            self._pending = None
     
     def transform(self, mode):
         """Transform text using AI"""
@@ -1114,55 +1658,53 @@ class AIAssistantDialog:
         
         # Get selected language
         lang_display = self.language_var.get()
-        language = self.lang_map.get(lang_display, "english")
-        
-        # Language instruction for AI
-        lang_instructions = {
-            "english": "Respond in English.",
-            "bengali": "Respond in Bengali (বাংলা). Use Bengali script.",
-            "korean": "Respond in Korean (한국어). Use Korean script (Hangul)."
-        }
-        lang_instruction = lang_instructions.get(language, "Respond in English.")
-        
-        # Define prompts for different modes
-        prompts = {
-            "question": f"{lang_instruction} Answer the following question or provide information about the following text:\n\n{input_text}",
-            "translate": f"Translate the following text to {language}. If it's already in {language}, translate it to English:\n\n{input_text}",
-            "email": f"{lang_instruction} Rephrase the following text as a professional, polite email. Use proper email format with greeting, body, and closing:\n\n{input_text}",
-            "improve": f"{lang_instruction} Improve the following text by making it clearer, more concise, and better written. Fix any grammar or style issues:\n\n{input_text}",
-            "poetic": f"{lang_instruction} Transform the following text into a poetic and creative version. Make it beautiful and artistic while preserving the core meaning:\n\n{input_text}",
-            "summarize": f"{lang_instruction} Provide a concise summary of the following text, capturing the main points:\n\n{input_text}",
-            "explain": f"{lang_instruction} Explain the following text in simple, easy-to-understand terms:\n\n{input_text}"
-        }
+        language = _LANG_MAP.get(lang_display, "english")
         
-        prompt = prompts.get(mode, input_text)
+        # Build only the prompt for the requested mode
+        template = _PROMPT_TEMPLATES.get(mode)
+        if template is None:
+            prompt = input_text
+        else:
+            prompt = template.format(
+                lang=_LANG_INSTRUCTIONS.get(language, _LANG_INSTRUCTIONS["english"]),
+                language=language,
+                text=input_text
+            )
         
         # Show loading status
         self.status_label.config(text="✨ AI is thinking...")
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert("1.0", "Generating...")
-        self.dialog.update()
         
         # Get selected model
         model = self.model_var.get()
         
-        # Run AI transformation in background thread
-        def run_ai():
-            try:
-                # Generate response using Ollama
-                result = self.notes_app.generate_text_ollama(prompt, max_tokens=500, model=model)
-                
-                if result:
-                    # Update UI in main thread
-                    self.dialog.after(0, lambda r=result: self.show_result(r))
-                else:
-                    self.dialog.after(0, lambda: self.show_error(f"Failed to generate text. Make sure Ollama is running and {model} model is installed."))
-            except Exception as e:
-                error_msg = str(e)
-                self.dialog.after(0, lambda msg=error_msg: self.show_error(msg))
+        # Run AI transformation on the app's shared AI worker thread; only
+        # the latest request may fill the output
+        self.drop_pending()
+        future = self._pending = self.notes_app.submit_ai(prompt, 500, model)
+        self.dialog.after(50, self.handle_result, future, model)
+    
+    def handle_result(self, future, model):
+        """Show the outcome of a finished AI request"""
+        if future is not self._pending:
+            return  # Superseded, or the dialog was hidden or reloaded
+        # The worker never touches Tk, so poll it from this thread
+        if not future.done():
+            self.dialog.after(50, self.handle_result, future, model)
+            return
+        self._pending = None
         
-        thread = threading.Thread(target=run_ai, daemon=True)
-        thread.start()
+        try:
+            result = future.result()
+        except Exception as e:
+            self.show_error(str(e))
+            return
+        
+        if result:
+            self.show_result(result)
+        else:
+            self.show_error(f"Failed to generate text. Make sure Ollama is running and {model} model is installed.")
     
     def show_result(self, result):
         """Display AI result"""
@@ -1195,7 +1737,7 @@ class AIAssistantDialog:
             self.notes_app.text_widget.insert(tk.INSERT, "\n\n" + result)
         
         self.notes_app.status_label.config(text="✨ AI text inserted")
-        self.dialog.destroy()
+        self.hide()
 
 
 class FindDialog:
@@ -1203,6 +1745,10 @@ class FindDialog:
         self.notes_app = notes_app
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("🔍 Find and Replace")
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # Length of the last match, as reported by Tk's text search
+        self._match_len = tk.IntVar(self.dialog)
         
         # Calculate responsive dialog size
         parent_width = parent.winfo_width()
@@ -1210,51 +1756,62 @@ class FindDialog:
         dialog_width = min(450, int(parent_width * 0.6))
         dialog_height = min(200, int(parent_height * 0.4))
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
+        self.create_ui()
+        
+        # Size and center the dialog in one geometry call, once it is built
         x = (self.dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (dialog_height // 2)
         self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-        
-        self.create_ui()
     
     def create_ui(self):
-        main_frame = tk.Frame(self.dialog, bg="#fff0f5", padx=20, pady=20)
+        main_frame = tk.Frame(self.dialog, padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Find field
-        find_label = tk.Label(main_frame, text="Find:", bg="#fff0f5", font=("Ubuntu", 10))
+        find_label = tk.Label(main_frame, text="Find:")
         find_label.grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        self.find_entry = ttk.Entry(main_frame, font=("Ubuntu", 10))
+        self.find_entry = ttk.Entry(main_frame, font=self.notes_app.fonts['ui'])
         self.find_entry.grid(row=0, column=1, sticky=tk.EW, padx=5, pady=5)
         self.find_entry.focus()
         
         # Replace field
-        replace_label = tk.Label(main_frame, text="Replace:", bg="#fff0f5", font=("Ubuntu", 10))
+        replace_label = tk.Label(main_frame, text="Replace:")
         replace_label.grid(row=1, column=0, sticky=tk.W, pady=5)
         
-        self.replace_entry = ttk.Entry(main_frame, font=("Ubuntu", 10))
+        self.replace_entry = ttk.Entry(main_frame, font=self.notes_app.fonts['ui'])
         self.replace_entry.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=5)
         
         # Buttons
-        button_frame = tk.Frame(main_frame, bg="#fff0f5")
+        button_frame = tk.Frame(main_frame)
         button_frame.grid(row=2, column=0, columnspan=2, pady=15)
         
         ttk.Button(button_frame, text="Find Next", command=self.find_next).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Replace", command=self.replace_current).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Replace All", command=self.replace_all).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Close", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=self.hide).pack(side=tk.LEFT, padx=5)
         
         main_frame.columnconfigure(1, weight=1)
         
         # Bind Enter key to find next
         self.find_entry.bind('<Return>', lambda e: self.find_next())
     
+    def show(self):
+        """Show the dialog again after it was hidden"""
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+        self.find_entry.focus_set()
+        self.find_entry.select_range(0, tk.END)
+    
+    def hide(self):
+        """Hide the dialog so the next open can reuse it"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
     def find_next(self):
         """Find next occurrence of search text"""
         search_text = self.find_entry.get()
@@ -1262,31 +1819,26 @@ class FindDialog:
             return
         
         # Get current cursor position
-        start_pos = self.notes_app.text_widget.index(tk.INSERT)
+        text_widget = self.notes_app.text_widget
+        start_pos = text_widget.index(tk.INSERT)
         
-        # Search from current position
-        pos = self.notes_app.text_widget.search(search_text, start_pos, tk.END, nocase=True)
+        # Search from current position; without a stop index Tk wraps
+        # around to the start of the note by itself
+        pos = text_widget.search(search_text, start_pos, nocase=True, count=self._match_len)
         
         if pos:
             # Select found text
-            end_pos = f"{pos}+{len(search_text)}c"
-            self.notes_app.text_widget.tag_remove(tk.SEL, "1.0", tk.END)
-            self.notes_app.text_widget.tag_add(tk.SEL, pos, end_pos)
-            self.notes_app.text_widget.mark_set(tk.INSERT, end_pos)
-            self.notes_app.text_widget.see(pos)
-            self.notes_app.status_label.config(text=f"Found: {search_text}")
-        else:
-            # Try from beginning
-            pos = self.notes_app.text_widget.search(search_text, "1.0", tk.END, nocase=True)
-            if pos:
-                end_pos = f"{pos}+{len(search_text)}c"
-                self.notes_app.text_widget.tag_remove(tk.SEL, "1.0", tk.END)
-                self.notes_app.text_widget.tag_add(tk.SEL, pos, end_pos)
-                self.notes_app.text_widget.mark_set(tk.INSERT, end_pos)
-                self.notes_app.text_widget.see(pos)
+            end_pos = f"{pos}+{self._match_len.get()}c"
+            text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+            text_widget.tag_add(tk.SEL, pos, end_pos)
+            text_widget.mark_set(tk.INSERT, end_pos)
+            text_widget.see(pos)
+            if text_widget.compare(pos, "<", start_pos):
                 self.notes_app.status_label.config(text=f"Found: {search_text} (from start)")
             else:
-                self.notes_app.status_label.config(text="Not found")
+                self.notes_app.status_label.config(text=f"Found: {search_text}")
+        else:
+            self.notes_app.status_label.config(text="Not found")
     
     def replace_current(self):
         """Replace current selection"""
@@ -1311,24 +1863,52 @@ class FindDialog:
         if not search_text:
             return
         
-        content = self.notes_app.text_widget.get("1.0", tk.END)
-        count = content.lower().count(search_text.lower())
+        text_widget = self.notes_app.text_widget
+        
+        # Replace matches in place with Tk's search instead of copying the
+        # whole note into Python, grouped into a single undo step
+        count = 0
+        pos = "1.0"
+        text_widget.edit_separator()
+        text_widget.config(autoseparators=False)
+        try:
+            while True:
+                pos = text_widget.search(search_text, pos, tk.END, nocase=True, count=self._match_len)
+                if not pos:
+                    break
+                text_widget.delete(pos, f"{pos}+{self._match_len.get()}c")
+                # Read the end back from the insert mark; Tcl's character
+                # count can differ from len() for non-BMP text
+                text_widget.mark_set(tk.INSERT, pos)
+                text_widget.insert(tk.INSERT, replace_text)
+                pos = text_widget.index(tk.INSERT)
+                count += 1
+        finally:
+            text_widget.config(autoseparators=True)
+            text_widget.edit_separator()
         
         if count > 0:
-            # Case-insensitive replace
-            import re
-            new_content = re.sub(re.escape(search_text), replace_text, content, flags=re.IGNORECASE)
-            self.notes_app.text_widget.delete("1.0", tk.END)
-            self.notes_app.text_widget.insert("1.0", new_content)
             self.notes_app.status_label.config(text=f"Replaced {count} occurrence(s)")
         else:
             self.notes_app.status_label.config(text="Not found")
 
 class CodeBlockPreviewDialog:
+    # Lines inserted per idle callback, so long blocks never block the UI
+    HIGHLIGHT_CHUNK_LINES = 500
+    
+    __slots__ = (
+        'notes_app', 'dialog', '_fence_len', 'code_blocks', 'current_block_index', '_hl_job', '_hl_cache',
+        'prev_button', 'block_label', 'next_button', 'lang_label', 'code_text'
+    )
+    
     def __init__(self, parent, notes_app):
         self.notes_app = notes_app
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("👁️ Code Block Preview")
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # Length of the last opening fence, as reported by Tk's text search
+        self._fence_len = tk.IntVar(self.dialog)
         
         # Calculate responsive dialog size (90% of parent window)
         parent_width = parent.winfo_width()
@@ -1336,70 +1916,101 @@ class CodeBlockPreviewDialog:
         dialog_width = min(800, int(parent_width * 0.9))
         dialog_height = min(600, int(parent_height * 0.9))
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
+        self.code_blocks = []
+        self.current_block_index = 0
+        
+        # Pending idle callback inserting the rest of a highlighted block, and
+        # the highlighted chunks of each block already shown
+        self._hl_job = None
+        self._hl_cache = {}
+        
+        self.create_ui()
+        
+        # Size and center the dialog in one geometry call, once it is built
         x = (self.dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (dialog_height // 2)
         self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
         
+        self.show()
+    
+    def show(self):
+        """Show the code blocks of the current note"""
         # Extract code blocks from current note
         self.code_blocks = self.extract_code_blocks()
         self.current_block_index = 0
+        self._hl_cache = {}
         
-        self.create_ui()
+        # Pick up a code_preview_theme change made since the last open
+        self.setup_syntax_tags()
         
         if self.code_blocks:
+            self.dialog.deiconify()
+            self.dialog.lift()
+            self.dialog.grab_set()
             self.display_block(0)
         else:
             messagebox.showinfo("No Code Blocks", "No code blocks found in the current note.\\n\\nUse ```language\\ncode\\n``` format to create code blocks.")
-            self.dialog.destroy()
+            self.hide()
+    
+    def hide(self):
+        """Hide the dialog so the next open can reuse it"""
+        self.cancel_highlighting()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
     
     def extract_code_blocks(self):
         """Extract all code blocks from the current note"""
-        content = self.notes_app.text_widget.get("1.0", tk.END)
-        blocks = []
-        
-        import re
-        # Match code blocks with optional language
-        pattern = r'```(\w+)?\n(.*?)```'
-        matches = re.findall(pattern, content, re.DOTALL)
-        
-        for lang, code in matches:
-            blocks.append({
-                'language': lang if lang else 'text',
-                'code': code.strip()
-            })
+        text_widget = self.notes_app.text_widget
+        fence_len = self._fence_len
         
+        # Find ```lang\n ... ``` fences with Tk's search and only record where
+        # each block's code lies; block_code reads it when the block is shown
+        blocks = []
+        pos = "1.0"
+        while True:
+            start = text_widget.search(r'```\w*\n', pos, tk.END, regexp=True, count=fence_len)
+            if not start:
+                break
+            code_start = f"{start}+{fence_len.get()}c"
+            code_end = text_widget.search('```', code_start, tk.END)
+            if not code_end:
+                break
+            language = text_widget.get(f"{start}+3c", f"{start}+{fence_len.get() - 1}c")
+            blocks.append({'language': language or 'text', 'span': (code_start, code_end)})
+            pos = f"{code_end}+3c"
         return blocks
     
+    def block_code(self, index):
+        """Get the code of a block extracted by extract_code_blocks"""
+        start, end = self.code_blocks[index]['span']
+        return self.notes_app.text_widget.get(start, end).strip()
+    
     def create_ui(self):
-        main_frame = tk.Frame(self.dialog, bg="#fff0f5", padx=15, pady=15)
+        main_frame = tk.Frame(self.dialog, padx=15, pady=15)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title and navigation
-        header_frame = tk.Frame(main_frame, bg="#fff0f5")
+        header_frame = tk.Frame(main_frame)
         header_frame.pack(fill=tk.X, pady=(0, 10))
         
         title_label = tk.Label(
             header_frame,
             text="Code Block Preview",
-            font=("Ubuntu", 14, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['hdr']
         )
         title_label.pack(side=tk.LEFT)
         
         # Navigation buttons
-        nav_frame = tk.Frame(header_frame, bg="#fff0f5")
+        nav_frame = tk.Frame(header_frame)
         nav_frame.pack(side=tk.RIGHT)
         
         self.prev_button = ttk.Button(nav_frame, text="Previous", command=self.prev_block)
         self.prev_button.pack(side=tk.LEFT, padx=2)
         
-        self.block_label = tk.Label(nav_frame, text="", bg="#fff0f5", font=("Ubuntu", 10))
+        self.block_label = tk.Label(nav_frame, text="")
         self.block_label.pack(side=tk.LEFT, padx=10)
         
         self.next_button = ttk.Button(nav_frame, text="Next", command=self.next_block)
@@ -1409,30 +2020,18 @@ class CodeBlockPreviewDialog:
         self.lang_label = tk.Label(
             main_frame,
             text="Language: ",
-            font=("Ubuntu", 10, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['ui_bold']
         )
         self.lang_label.pack(anchor=tk.W, pady=(0, 5))
         
         # Code display with syntax highlighting
-        code_frame = tk.Frame(main_frame, bg="#fff0f5")
+        code_frame = tk.Frame(main_frame)
         code_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Get theme
-        theme = self.notes_app.config.get('code_preview_theme', 'light')
-        if theme == 'dark':
-            bg_color = '#1E1E1E'
-            fg_color = '#D4D4D4'
-        else:
-            bg_color = '#F5F5F5'
-            fg_color = '#000000'
-        
         self.code_text = scrolledtext.ScrolledText(
             code_frame,
-            font=("Roboto Mono", 11),
+            font=self.notes_app.fonts['code'],
             wrap=tk.NONE,
-            bg=bg_color,
-            fg=fg_color,
             relief=tk.FLAT,
             borderwidth=1,
             highlightthickness=1,
@@ -1442,11 +2041,8 @@ class CodeBlockPreviewDialog:
         )
         self.code_text.pack(fill=tk.BOTH, expand=True)
         
-        # Configure syntax highlighting tags
-        self.setup_syntax_tags()
-        
         # Action buttons
-        button_frame = tk.Frame(main_frame, bg="#fff0f5")
+        button_frame = tk.Frame(main_frame)
         button_frame.pack()
         
         ttk.Button(
@@ -1458,15 +2054,16 @@ class CodeBlockPreviewDialog:
         ttk.Button(
             button_frame,
             text="Close",
-            command=self.dialog.destroy
+            command=self.hide
         ).pack(side=tk.LEFT, padx=5)
     
     def setup_syntax_tags(self):
-        """Setup tags for syntax highlighting"""
+        """Apply the preview theme colors and syntax highlighting tags"""
         theme = self.notes_app.config.get('code_preview_theme', 'light')
         
         if theme == 'dark':
             # Dark theme colors
+            self.code_text.config(bg='#1E1E1E', fg='#D4D4D4')
             self.code_text.tag_config('keyword', foreground='#569CD6')
             self.code_text.tag_config('string', foreground='#CE9178')
             self.code_text.tag_config('comment', foreground='#6A9955')
@@ -1474,63 +2071,79 @@ class CodeBlockPreviewDialog:
             self.code_text.tag_config('number', foreground='#B5CEA8')
         else:
             # Light theme colors
+            self.code_text.config(bg='#F5F5F5', fg='#000000')
             self.code_text.tag_config('keyword', foreground='#0000FF')
             self.code_text.tag_config('string', foreground='#A31515')
             self.code_text.tag_config('comment', foreground='#008000')
             self.code_text.tag_config('function', foreground='#795E26')
             self.code_text.tag_config('number', foreground='#098658')
     
-    def apply_syntax_highlighting(self, code, language):
-        """Apply basic syntax highlighting"""
-        import re
-        
-        # Common keywords for different languages
-        keywords = {
-            'python': ['def', 'class', 'import', 'from', 'if', 'else', 'elif', 'for', 'while', 'return', 'try', 'except', 'with', 'as', 'in', 'is', 'and', 'or', 'not', 'None', 'True', 'False'],
-            'javascript': ['function', 'const', 'let', 'var', 'if', 'else', 'for', 'while', 'return', 'class', 'import', 'export', 'from', 'async', 'await', 'true', 'false', 'null'],
-            'java': ['public', 'private', 'class', 'static', 'void', 'int', 'String', 'if', 'else', 'for', 'while', 'return', 'new', 'true', 'false', 'null'],
-            'c': ['int', 'char', 'float', 'double', 'if', 'else', 'for', 'while', 'return', 'void', 'struct', 'typedef', 'include'],
-            'cpp': ['int', 'char', 'float', 'double', 'if', 'else', 'for', 'while', 'return', 'void', 'class', 'public', 'private', 'namespace', 'using'],
-        }
-        
-        lang_keywords = keywords.get(language.lower(), keywords.get('python', []))
+    def insert_code(self, index):
+        """Insert a code block with its syntax tags attached as it is inserted"""
+        self.cancel_highlighting()
+        
+        cached = self._hl_cache.get(index)
+        if cached is not None:
+            # Shown before: replay its tagged chunks without scanning it again
+            self.insert_chunks(iter(cached), index, None)
+        else:
+            block = self.code_blocks[index]
+            self.insert_chunks(self.highlight_chunks(self.block_code(index), block['language']), index, [])
+    
+    def highlight_chunks(self, code, language):
+        """Yield Text.insert arguments for a block, HIGHLIGHT_CHUNK_LINES lines at a time"""
+        language = language.lower()
+        if language not in _HIGHLIGHTED_LANGS:
+            # Plain text and unknown languages are shown unstyled
+            yield [code, ()]
+            return
         
-        lines = code.split('\n')
-        for i, line in enumerate(lines):
-            line_start = f"{i+1}.0"
-            
-            # Highlight comments
-            if language.lower() in ['python', 'bash', 'shell']:
-                comment_match = re.search(r'#.*$', line)
-                if comment_match:
-                    start = f"{i+1}.{comment_match.start()}"
-                    end = f"{i+1}.{comment_match.end()}"
-                    self.code_text.tag_add('comment', start, end)
-            elif language.lower() in ['javascript', 'java', 'c', 'cpp']:
-                comment_match = re.search(r'//.*$', line)
-                if comment_match:
-                    start = f"{i+1}.{comment_match.start()}"
-                    end = f"{i+1}.{comment_match.end()}"
-                    self.code_text.tag_add('comment', start, end)
-            
-            # Highlight strings
-            for string_match in re.finditer(r'["\'].*?["\']', line):
-                start = f"{i+1}.{string_match.start()}"
-                end = f"{i+1}.{string_match.end()}"
-                self.code_text.tag_add('string', start, end)
+        highlight_re = _HIGHLIGHT_RE[language]
+        
+        # Offset of each line's first character, used to split the block
+        # into chunks of whole lines
+        line_starts = [0]
+        newline = code.find('\n')
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = code.find('\n', newline + 1)
+        line_starts.append(len(code) + 1)
+        line_count = len(line_starts) - 1
+        
+        for first_line in range(0, line_count, self.HIGHLIGHT_CHUNK_LINES):
+            last_line = min(first_line + self.HIGHLIGHT_CHUNK_LINES, line_count)
+            chunk_start = line_starts[first_line]
+            chunk_end = min(line_starts[last_line], len(code))
             
-            # Highlight numbers
-            for num_match in re.finditer(r'\b\d+\.?\d*\b', line):
-                start = f"{i+1}.{num_match.start()}"
-                end = f"{i+1}.{num_match.end()}"
-                self.code_text.tag_add('number', start, end)
-            
-            # Highlight keywords
-            for keyword in lang_keywords:
-                for match in re.finditer(r'\b' + re.escape(keyword) + r'\b', line):
-                    start = f"{i+1}.{match.start()}"
-                    end = f"{i+1}.{match.end()}"
-                    self.code_text.tag_add('keyword', start, end)
+            # Interleave plain text and tagged tokens for a single Text.insert call
+            args = []
+            pos = chunk_start
+            for match in highlight_re.finditer(code, chunk_start, chunk_end):
+                start, end = match.span()
+                args += (code[pos:start], (), code[start:end], match.lastgroup)
+                pos = end
+            args += (code[pos:chunk_end], ())
+            yield args
+    
+    def insert_chunks(self, chunks, index, seen):
+        """Insert the next chunk of a block, then schedule the rest when idle"""
+        args = next(chunks, None)
+        if args is None:
+            self._hl_job = None
+            if seen is not None:
+                self._hl_cache[index] = seen
+            return
+        
+        if seen is not None:
+            seen.append(args)
+        self.code_text.insert(tk.END, *args)
+        self._hl_job = self.dialog.after_idle(self.insert_chunks, chunks, index, seen)
+    
+    def cancel_highlighting(self):
+        """Stop highlighting a block that is no longer shown"""
+        if self._hl_job is not None:
+            self.dialog.after_cancel(self._hl_job)
+            self._hl_job = None
     
     def display_block(self, index):
         """Display a specific code block"""
@@ -1548,12 +2161,9 @@ class CodeBlockPreviewDialog:
             self.prev_button.config(state=tk.NORMAL if index > 0 else tk.DISABLED)
             self.next_button.config(state=tk.NORMAL if index < len(self.code_blocks) - 1 else tk.DISABLED)
             
-            # Display code
+            # Display code, syntax highlighted
             self.code_text.delete("1.0", tk.END)
-            self.code_text.insert("1.0", block['code'])
-            
-            # Apply syntax highlighting
-            self.apply_syntax_highlighting(block['code'], block['language'])
+            self.insert_code(index)
     
     def prev_block(self):
         """Show previous code block"""
@@ -1568,12 +2178,17 @@ class CodeBlockPreviewDialog:
     def copy_to_clipboard(self):
         """Copy current code block to clipboard"""
         if self.code_blocks:
-            code = self.code_blocks[self.current_block_index]['code']
+            code = self.block_code(self.current_block_index)
             self.dialog.clipboard_clear()
             self.dialog.clipboard_append(code)
             messagebox.showinfo("Copied", "Code copied to clipboard!")
 
 class SettingsDialog:
+    __slots__ = (
+        'notes_app', 'dialog', 'font_family_var', 'font_size_var', 'text_color_var', 'bg_color_var',
+        'language_var', 'ai_model_var', 'code_theme_var', 'sidebar_width_var', 'scale_var'
+    )
+    
     def __init__(self, parent, notes_app):
         self.notes_app = notes_app
         self.dialog = tk.Toplevel(parent)
@@ -1585,40 +2200,37 @@ class SettingsDialog:
         dialog_width = min(600, int(parent_width * 0.7))
         dialog_height = min(550, int(parent_height * 0.8))
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
+        self.create_ui()
+        
+        # Size and center the dialog in one geometry call, once it is built
         x = (self.dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (dialog_height // 2)
         self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-        
-        self.create_ui()
     
     def create_ui(self):
         # Main container for the entire dialog
-        container = tk.Frame(self.dialog, bg="#fff0f5")
+        container = tk.Frame(self.dialog)
         container.pack(fill=tk.BOTH, expand=True)
         
         # Top frame for title and scrollable content
-        main_frame = tk.Frame(container, bg="#fff0f5", padx=20)
+        main_frame = tk.Frame(container, padx=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
         title_label = tk.Label(
             main_frame,
             text="Customization Settings",
-            font=("Ubuntu", 14, "bold"),
-            bg="#fff0f5"
+            font=self.notes_app.fonts['hdr']
         )
         title_label.pack(pady=(0, 15))
         
         # Create scrollable frame for settings
-        canvas = tk.Canvas(main_frame, bg="#fff0f5", highlightthickness=0)
+        canvas = tk.Canvas(main_frame, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#fff0f5")
+        scrollable_frame = tk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
@@ -1632,18 +2244,10 @@ class SettingsDialog:
         scrollbar.pack(side="right", fill="y")
         
         # Theme Presets
-        theme_frame = tk.LabelFrame(scrollable_frame, text="🎨 Theme Presets", bg="#fff0f5", font=("Ubuntu", 11, "bold"), padx=10, pady=10)
+        theme_frame = tk.LabelFrame(scrollable_frame, text="🎨 Theme Presets", padx=10, pady=10)
         theme_frame.pack(fill=tk.X, pady=10)
         
-        themes = [
-            ("Pink (Default)", "pink"),
-            ("Dark Mode", "dark"),
-            ("Light Mode", "light"),
-            ("Ocean Blue", "ocean"),
-            ("Forest Green", "forest")
-        ]
-        
-        for theme_name, theme_id in themes:
+        for theme_name, theme_id in _THEME_CHOICES:
             btn = ttk.Button(
                 theme_frame,
                 text=theme_name,
@@ -1652,24 +2256,21 @@ class SettingsDialog:
             btn.pack(side=tk.LEFT, padx=5)
         
         # Font Settings
-        font_frame = tk.LabelFrame(scrollable_frame, text="🔤 Font Settings", bg="#fff0f5", font=("Ubuntu", 11, "bold"), padx=10, pady=10)
+        font_frame = tk.LabelFrame(scrollable_frame, text="🔤 Font Settings", padx=10, pady=10)
         font_frame.pack(fill=tk.X, pady=10)
         
         # Font Family
-        family_label = tk.Label(font_frame, text="Font Family:", font=("Ubuntu", 10), bg="#fff0f5")
+        family_label = tk.Label(font_frame, text="Font Family:")
         family_label.pack(anchor=tk.W)
         
         self.font_family_var = tk.StringVar(value=self.notes_app.config['font_family'])
-        font_families = ["Roboto Mono", "Ubuntu Mono", "Courier New", "Monospace", "Arial", "Times New Roman"]
-        font_dropdown = ttk.Combobox(font_frame, textvariable=self.font_family_var, values=font_families, state="readonly")
+        font_dropdown = ttk.Combobox(font_frame, textvariable=self.font_family_var, values=_FONT_FAMILIES, state="readonly")
         font_dropdown.pack(fill=tk.X, pady=5)
         
         # Font Size
         size_label = tk.Label(
             font_frame,
-            text=f"Font Size: {self.notes_app.config['font_size']}",
-            font=("Ubuntu", 10),
-            bg="#fff0f5"
+            text=f"Font Size: {self.notes_app.config['font_size']}"
         )
         size_label.pack(anchor=tk.W, pady=(10, 0))
         
@@ -1680,26 +2281,24 @@ class SettingsDialog:
             to=36,
             orient=tk.HORIZONTAL,
             variable=self.font_size_var,
-            bg="#fff0f5",
             command=lambda v: size_label.config(text=f"Font Size: {v}")
         )
         font_slider.pack(fill=tk.X, pady=5)
         
         # Color Settings
-        color_frame = tk.LabelFrame(scrollable_frame, text="🎨 Color Settings", bg="#fff0f5", font=("Ubuntu", 11, "bold"), padx=10, pady=10)
+        color_frame = tk.LabelFrame(scrollable_frame, text="🎨 Color Settings", padx=10, pady=10)
         color_frame.pack(fill=tk.X, pady=10)
         
         # Text Color
-        text_color_label = tk.Label(color_frame, text="Text Color:", font=("Ubuntu", 10), bg="#fff0f5")
+        text_color_label = tk.Label(color_frame, text="Text Color:")
         text_color_label.pack(anchor=tk.W)
         
         self.text_color_var = tk.StringVar(value=self.notes_app.config['text_color'])
-        text_colors = [("Black", "#000000"), ("Blue", "#0000FF"), ("Green", "#008000"), ("Red", "#FF0000"), ("Purple", "#800080"), ("White", "#FFFFFF")]
         
-        text_color_buttons = tk.Frame(color_frame, bg="#fff0f5")
+        text_color_buttons = tk.Frame(color_frame)
         text_color_buttons.pack(fill=tk.X, pady=5)
         
-        for color_name, color_code in text_colors:
+        for color_name, color_code in _TEXT_COLORS:
             btn = tk.Button(
                 text_color_buttons,
                 text=color_name,
@@ -1711,16 +2310,15 @@ class SettingsDialog:
             btn.pack(side=tk.LEFT, padx=2)
         
         # Background Color
-        bg_color_label = tk.Label(color_frame, text="Editor Background:", font=("Ubuntu", 10), bg="#fff0f5")
+        bg_color_label = tk.Label(color_frame, text="Editor Background:")
         bg_color_label.pack(anchor=tk.W, pady=(10, 0))
         
         self.bg_color_var = tk.StringVar(value=self.notes_app.config['bg_color'])
-        bg_colors = [("White", "#FFFFFF"), ("Light Gray", "#F0F0F0"), ("Cream", "#FFFDD0"), ("Light Blue", "#E6F2FF"), ("Light Green", "#E8F5E9"), ("Black", "#000000")]
         
-        bg_color_buttons = tk.Frame(color_frame, bg="#fff0f5")
+        bg_color_buttons = tk.Frame(color_frame)
         bg_color_buttons.pack(fill=tk.X, pady=5)
         
-        for color_name, color_code in bg_colors:
+        for color_name, color_code in _BG_COLORS:
             btn = tk.Button(
                 bg_color_buttons,
                 text=color_name,
@@ -1732,31 +2330,21 @@ class SettingsDialog:
             btn.pack(side=tk.LEFT, padx=2)
         
         # AI Settings
-        ai_frame = tk.LabelFrame(scrollable_frame, text="🤖 AI Settings", bg="#fff0f5", font=("Ubuntu", 11, "bold"), padx=10, pady=10)
+        ai_frame = tk.LabelFrame(scrollable_frame, text="🤖 AI Settings", padx=10, pady=10)
         ai_frame.pack(fill=tk.X, pady=10)
         
         # Language Preference
-        lang_label = tk.Label(ai_frame, text="Preferred Language:", font=("Ubuntu", 10), bg="#fff0f5")
+        lang_label = tk.Label(ai_frame, text="Preferred Language:")
         lang_label.pack(anchor=tk.W)
         
-        languages = [
-            ("English", "english"),
-            ("বাংলা (Bengali)", "bengali"),
-            ("한국어 (Korean)", "korean")
-        ]
         self.language_var = tk.StringVar(value=self.notes_app.config.get('language', 'english'))
-        lang_display_names = [lang[0] for lang in languages]
-        lang_map = {lang[1]: lang[0] for lang in languages}
         
-        lang_dropdown = ttk.Combobox(ai_frame, textvariable=self.language_var, values=lang_display_names, state="readonly")
-        lang_dropdown.set(lang_map.get(self.notes_app.config.get('language', 'english'), "English"))
+        lang_dropdown = ttk.Combobox(ai_frame, textvariable=self.language_var, values=_LANG_DISPLAY, state="readonly")
+        lang_dropdown.set(_LANG_REVERSE.get(self.notes_app.config.get('language', 'english'), "English"))
         lang_dropdown.pack(fill=tk.X, pady=5)
         
-        # Store mapping for later use
-        self.lang_reverse_map = {lang[0]: lang[1] for lang in languages}
-        
         # Default AI Model
-        model_label = tk.Label(ai_frame, text="Default AI Model:", font=("Ubuntu", 10), bg="#fff0f5")
+        model_label = tk.Label(ai_frame, text="Default AI Model:")
         model_label.pack(anchor=tk.W, pady=(10, 0))
         
         available_models = self.notes_app.get_available_models()
@@ -1765,7 +2353,7 @@ class SettingsDialog:
         model_dropdown.pack(fill=tk.X, pady=5)
         
         # Code Preview Theme
-        preview_label = tk.Label(ai_frame, text="Code Preview Theme:", font=("Ubuntu", 10), bg="#fff0f5")
+        preview_label = tk.Label(ai_frame, text="Code Preview Theme:")
         preview_label.pack(anchor=tk.W, pady=(10, 0))
         
         self.code_theme_var = tk.StringVar(value=self.notes_app.config.get('code_preview_theme', 'light'))
@@ -1773,15 +2361,13 @@ class SettingsDialog:
         theme_dropdown.pack(fill=tk.X, pady=5)
         
         # Window Settings
-        window_frame = tk.LabelFrame(scrollable_frame, text="📐 Window Settings", bg="#fff0f5", font=("Ubuntu", 11, "bold"), padx=10, pady=10)
+        window_frame = tk.LabelFrame(scrollable_frame, text="📐 Window Settings", padx=10, pady=10)
         window_frame.pack(fill=tk.X, pady=10)
         
         # Sidebar Width
         sidebar_label = tk.Label(
             window_frame,
-            text=f"Sidebar Width: {self.notes_app.config['sidebar_width']}px",
-            font=("Ubuntu", 10),
-            bg="#fff0f5"
+            text=f"Sidebar Width: {self.notes_app.config['sidebar_width']}px"
         )
         sidebar_label.pack(anchor=tk.W)
         
@@ -1792,7 +2378,6 @@ class SettingsDialog:
             to=400,
             orient=tk.HORIZONTAL,
             variable=self.sidebar_width_var,
-            bg="#fff0f5",
             command=lambda v: sidebar_label.config(text=f"Sidebar Width: {v}px")
         )
         sidebar_slider.pack(fill=tk.X, pady=5)
@@ -1800,9 +2385,7 @@ class SettingsDialog:
         # Window Scale
         scale_label = tk.Label(
             window_frame,
-            text=f"Window Scale: {self.notes_app.config['window_scale']:.1f}x",
-            font=("Ubuntu", 10),
-            bg="#fff0f5"
+            text=f"Window Scale: {self.notes_app.config['window_scale']:.1f}x"
         )
         scale_label.pack(anchor=tk.W, pady=(10, 0))
         
@@ -1814,7 +2397,6 @@ class SettingsDialog:
             resolution=0.1,
             orient=tk.HORIZONTAL,
             variable=self.scale_var,
-            bg="#fff0f5",
             command=lambda v: scale_label.config(text=f"Window Scale: {float(v):.1f}x")
         )
         scale_slider.pack(fill=tk.X, pady=5)
@@ -1823,14 +2405,13 @@ class SettingsDialog:
         info_label = tk.Label(
             scrollable_frame,
             text="💡 Tip: Some settings require app restart to take full effect",
-            font=("Ubuntu", 9),
-            bg="#fff0f5",
+            font=self.notes_app.fonts['small'],
             fg="#666666"
         )
         info_label.pack(pady=10)
         
         # Bottom frame for action buttons (outside scrollable area)
-        bottom_frame = tk.Frame(container, bg="#fff0f5", padx=20, pady=10)
+        bottom_frame = tk.Frame(container, padx=20, pady=10)
         bottom_frame.pack(fill=tk.X, side=tk.BOTTOM)
         
         # Separator line
@@ -1838,7 +2419,7 @@ class SettingsDialog:
         separator.pack(fill=tk.X, pady=(0, 10))
         
         # Action buttons
-        button_frame = tk.Frame(bottom_frame, bg="#fff0f5")
+        button_frame = tk.Frame(bottom_frame)
         button_frame.pack()
         
         apply_button = ttk.Button(
@@ -1857,41 +2438,8 @@ class SettingsDialog:
     
     def apply_theme(self, theme_id):
         """Apply a preset theme"""
-        themes = {
-            "pink": {
-                'text_color': '#000000',
-                'bg_color': '#FFFFFF',
-                'sidebar_bg': '#ffe8f0',
-                'editor_bg': '#fff0f5'
-            },
-            "dark": {
-                'text_color': '#FFFFFF',
-                'bg_color': '#1E1E1E',
-                'sidebar_bg': '#252525',
-                'editor_bg': '#2D2D2D'
-            },
-            "light": {
-                'text_color': '#000000',
-                'bg_color': '#FFFFFF',
-                'sidebar_bg': '#F5F5F5',
-                'editor_bg': '#FAFAFA'
-            },
-            "ocean": {
-                'text_color': '#003366',
-                'bg_color': '#E6F2FF',
-                'sidebar_bg': '#CCE5FF',
-                'editor_bg': '#E6F2FF'
-            },
-            "forest": {
-                'text_color': '#1B5E20',
-                'bg_color': '#F1F8E9',
-                'sidebar_bg': '#DCEDC8',
-                'editor_bg': '#F1F8E9'
-            }
-        }
-        
-        if theme_id in themes:
-            theme = themes[theme_id]
+        if theme_id in _THEMES:
+            theme = _THEMES[theme_id]
             self.text_color_var.set(theme['text_color'])
             self.bg_color_var.set(theme['bg_color'])
             messagebox.showinfo("Theme Applied", f"'{theme_id.title()}' theme colors set! Click 'Apply Settings' to save.")
@@ -1908,7 +2456,7 @@ class SettingsDialog:
         
         # Update AI settings
         lang_display = self.language_var.get()
-        self.notes_app.config['language'] = self.lang_reverse_map.get(lang_display, 'english')
+        self.notes_app.config['language'] = _LANG_MAP.get(lang_display, 'english')
         self.notes_app.config['ai_model'] = self.ai_model_var.get()
         self.notes_app.config['code_preview_theme'] = self.code_theme_var.get()
         
@@ -1916,8 +2464,11 @@ class SettingsDialog:
         self.notes_app.save_config()
         
         # Apply font and color changes immediately
+        self.notes_app.fonts['body'].configure(
+            family=self.notes_app.config['font_family'],
+            size=self.notes_app.config['font_size']
+        )
         self.notes_app.text_widget.config(
-            font=(self.notes_app.config['font_family'], self.notes_app.config['font_size']),
             fg=self.notes_app.config['text_color'],
             bg=self.notes_app.config['bg_color'],
             insertbackground=self.notes_app.config['text_color']
@@ -3,6 +3,7 @@
 
 from transformers import AutoTokenizer, AutoModelForCausalLM
 import torch
+import os
 
 print("Starting model download test...")
 print("This will download ~400MB on first run")
@@ -12,15 +13,15 @@ try:
     model_name = "Qwen/Qwen2.5-0.5B-Instruct"
     
     print(f"Loading tokenizer for {model_name}...")
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
     print("✓ Tokenizer loaded successfully")
     
     print(f"Loading model (this may take a few minutes)...")
+    # Safetensors weights are memory-mapped, so pages load on demand
     model = AutoModelForCausalLM.from_pretrained(
         model_name,
-        torch_dtype=torch.float32,
-        device_map="cpu",
-        low_cpu_mem_usage=True
+        torch_dtype=torch.bfloat16,
+        use_safetensors=True
     )
     print("✓ Model loaded successfully")
     
@@ -38,7 +39,23 @@ try:
     )
     
     inputs = tokenizer([text], return_tensors="pt")
-    outputs = model.generate(**inputs, max_new_tokens=50)
+    
+    # Greedy decoding with the KV cache, using every core this process may
+    # run on for the matmuls (affinity masks and containers can allow fewer
+    # than the host has)
+    if hasattr(os, "sched_getaffinity"):
+        torch.set_num_threads(len(os.sched_getaffinity(0)))
+    else:
+        torch.set_num_threads(os.cpu_count() or 1)
+    with torch.inference_mode():
+        outputs = model.generate(
+            **inputs,
+            max_new_tokens=50,
+            do_sample=False,
+            num_beams=1,
+            use_cache=True,
+            pad_token_id=tokenizer.eos_token_id
+        )
     result = tokenizer.decode(outputs[0], skip_special_tokens=True)
     
     print(f"Generated text: {result}")